@@ -1,6 +1,13 @@
 __all__ = ["FlatPlateAnalysis", "exp_kernel1", "CompositeMaterialUtility"]
 
 import numpy as np
+
+# prefer the LAPACK SPD factor/solve routines (dpotrf/dpotrs) from scipy,
+# fall back to a plain numpy solve if scipy isn't available
+try:
+    from scipy.linalg import cho_factor, cho_solve
+except ImportError:
+    cho_factor = cho_solve = None
 from tacs import pyTACS, constitutive, elements, utilities
 import os
 from pprint import pprint
@@ -152,13 +159,15 @@ class FlatPlateAnalysis:
                 break
             nominal_mode_unit = nominal_mode / np.linalg.norm(nominal_mode)
 
-            similarity_list = []
-            for new_mode in new_modes:
-                new_mode_unit = new_mode / np.linalg.norm(new_mode)
-                # compute cosine similarity with the unit vectors
-                similarity_list += [
-                    abs(np.dot(nominal_mode_unit, new_mode_unit).astype(np.double))
-                ]
+            # compute cosine similarity with the unit vectors
+            similarity_list = [
+                abs(
+                    np.dot(
+                        nominal_mode_unit, new_mode / np.linalg.norm(new_mode)
+                    ).astype(np.double)
+                )
+                for new_mode in new_modes
+            ]
 
             # compute the maximum similarity index
             if _debug:
@@ -505,40 +514,47 @@ class FlatPlateAnalysis:
         """
         interpolate the eigenvector from this object the nominal plate to a new mesh in non-dim coordinates
         """
-        X_train = self.nondim_X
+        X_train = np.asarray(self.nondim_X)
+        X_test = np.asarray(X_test)
         num_train = self.num_nodes
-        num_test = X_test.shape[0]
         # default hyperparameters
         sigma_n = 1e-4
         sigma_f = 1.0
         L = 0.4
-        _kernel = lambda xp, xq: exp_kernel1(xp, xq, sigma_f=sigma_f, L=L)
-        K_train = sigma_n**2 * np.eye(num_train) + np.array(
-            [
-                [_kernel(X_train[i, :], X_train[j, :]) for i in range(num_train)]
-                for j in range(num_train)
-            ]
-        )
-        K_test = np.array(
-            [
-                [_kernel(X_train[i, :], X_test[j, :]) for i in range(num_train)]
-                for j in range(num_test)
-            ]
-        )
+        # vectorized form of exp_kernel1 on all point pairs at once,
+        # using broadcasted pairwise square distances (no python double loop)
+        test_diff = X_train[np.newaxis, :, :] - X_test[:, np.newaxis, :]
+        K_test = sigma_f**2 * np.exp(-0.5 * np.sum(test_diff**2, axis=-1) / L**2)
 
         if not compute_covar:
-            _interpolated_eigenvectors = []
-            for imode in range(self.num_modes):
-                phi = self.get_eigenvector(imode)
-                if self._saved_alphas:  # skip linear solve in this case
-                    alpha = self._alphas[imode]
-                else:
-                    alpha = np.linalg.solve(K_train, phi)
-                    self._alphas[imode] = alpha
-                phi_star = K_test @ alpha
-                _interpolated_eigenvectors += [phi_star]
-            self._saved_alphas = True
-            return _interpolated_eigenvectors
+            if not self._saved_alphas:
+                # only need the train kernel matrix if the weights aren't saved yet
+                train_diff = X_train[np.newaxis, :, :] - X_train[:, np.newaxis, :]
+                K_train = sigma_n**2 * np.eye(num_train) + sigma_f**2 * np.exp(
+                    -0.5 * np.sum(train_diff**2, axis=-1) / L**2
+                )
+                Phi = np.stack(
+                    [self.get_eigenvector(imode) for imode in range(self.num_modes)],
+                    axis=1,
+                )
+                # K_train is SPD, so factor it once with Cholesky and
+                # solve all modes at once as a blocked right-hand side
+                if cho_factor is not None:
+                    K_factor = cho_factor(K_train)
+                    alpha_block = cho_solve(K_factor, Phi)
+                else:  # scipy unavailable, minimal drop-in
+                    alpha_block = np.linalg.solve(K_train, Phi)
+                for imode in range(self.num_modes):
+                    self._alphas[imode] = alpha_block[:, imode]
+                self._saved_alphas = True
+            else:  # skip linear solve in this case
+                alpha_block = np.stack(
+                    [self._alphas[imode] for imode in range(self.num_modes)], axis=1
+                )
+            # single GEMM for the predictions of every mode at once,
+            # rather than a GEMV per mode
+            phi_star_block = K_test @ alpha_block
+            return [phi_star_block[:, imode] for imode in range(self.num_modes)]
         else:
             raise AssertionError(
                 "Haven't written part of extrapolate eigenvector to get the conditional covariance yet."
@@ -864,10 +880,9 @@ class FlatPlateAnalysis:
         errors = []
         for imode in range(num_eig):
             eigval, eigvec = bucklingProb.getVariables(imode)
-            self._eigenvectors += [eigvec]
-            self._eigenvalues += [eigval]
-            error = bucklingProb.getModalError(imode)
-            errors += [error]
+            self._eigenvectors.append(eigvec)
+            self._eigenvalues.append(eigval)
+            errors.append(bucklingProb.getModalError(imode))
 
         if self.comm.rank == 0:
             pprint(funcs)
@@ -7,12 +7,14 @@ c-layer of TACS. This module uses the pyNastran library for its bdf parsing
 functionality.
 
 """
+
 # =============================================================================
 # Imports
 # =============================================================================
+from array import array
 from copy import deepcopy
-import itertools as it
 
+from mpi4py import MPI
 import numpy as np
 import pyNastran.bdf.bdf as pn
 
@@ -21,6 +23,26 @@ import tacs.constitutive
 import tacs.elements
 from tacs.utilities import BaseUI
 
+# TACS has a different node ordering than Nastran for certain element types.
+# Precomputed index permutations applied to the Nastran connectivity
+_NASTRAN_TO_TACS_NODE_ORDER = {
+    "CQUAD4": (0, 1, 3, 2),
+    "CQUADR": (0, 1, 3, 2),
+    "CQUAD9": (0, 4, 1, 7, 8, 5, 3, 6, 2),
+    "CQUAD": (0, 4, 1, 7, 8, 5, 3, 6, 2),
+    "CHEXA8": (0, 1, 3, 2, 4, 5, 7, 6),
+    "CHEXA": (0, 1, 3, 2, 4, 5, 7, 6),
+}
+
+# Precomputed fancy-index pattern for packing the lower triangle of a
+# CONM1 6x6 mass matrix, column-by-column, into TACS' 21-entry layout
+_CONM1_ROWS = np.array([row for col in range(6) for row in range(col, 6)])
+_CONM1_COLS = np.array([col for col in range(6) for row in range(col, 6)])
+# Off-diagonal moment of inertia terms have to be negated,
+# since they aren't in nastran convention
+_CONM1_SIGNS = np.ones(21)
+_CONM1_SIGNS[[16, 17, 19]] = -1.0
+
 
 class pyMeshLoader(BaseUI):
     def __init__(self, comm, printDebug=False):
@@ -29,11 +51,31 @@ class pyMeshLoader(BaseUI):
         # Debug printing flag
         self.printDebug = printDebug
         self.bdfInfo = None
+        # Memoized global-to-local node ID lookups (see getLocalNodeIDsFromGlobal)
+        self._localNodeIDCache = {}
+        # Contiguous nastran-to-tacs lookup arrays for vectorized idMap calls,
+        # built in _updateNastranToTACSDicts and keyed by ID dict identity
+        self._idMapArrays = {}
+        # Cached dof-string parses for dofStringToList/_dofStringToArray
+        self._dofListCache = {}
+        self._dofArrayCache = {}
 
-    def scanBdfFile(self, bdf):
+    def scanBdfFile(self, bdf, copyBDF=True):
         """
         Scan nastran bdf file using pyNastran's bdf parser.
         We also set up arrays that will be required later to build tacs.
+
+        Parameters
+        ----------
+        bdf : str or pyNastran.bdf.bdf.BDF
+            The BDF file or a pyNastran BDF object to load.
+
+        copyBDF : bool
+            If a pyNastran BDF object is provided, flag for whether to deep copy
+            it before loading. Deep copying (the default) leaves the user's object
+            untouched but is expensive for large models. Set to False to use the
+            object in place, in which case the mesh loader may modify it
+            (e.g. adding dummy property cards or RBE multiplier nodes).
         """
 
         # Only print debug info on root, if requested
@@ -51,9 +93,13 @@ class pyMeshLoader(BaseUI):
             self.bdfInfo = pn.read_bdf(
                 bdf, validate=False, xref=False, debug=debugPrint
             )
-        # Create a copy of the BDF object
+        # Use the BDF object directly, only copying it if the user requested one,
+        # since deep copying large pyNastran models is expensive
         elif isinstance(bdf, pn.BDF):
-            self.bdfInfo = deepcopy(bdf)
+            if copyBDF:
+                self.bdfInfo = deepcopy(bdf)
+            else:
+                self.bdfInfo = bdf
         else:
             raise self._TACSError(
                 "BDF input must be provided as a file name 'str' or pyNastran 'BDF' object. "
@@ -67,20 +113,15 @@ class pyMeshLoader(BaseUI):
         # so pynastran doesn't through errors when cross-referencing
         # Loop through all elements and add dummy property, as necessary
         self.bdfInfo.missing_properties = False
-        for element_id in self.bdfInfo.elements:
-            element = self.bdfInfo.elements[element_id]
-            if element.pid not in self.bdfInfo.property_ids:
-                # If no material properties were found,
-                # add dummy properties and materials
-                matID = 1
-                E = 70.0
-                G = 35.0
-                nu = 0.3
-                self.bdfInfo.add_mat1(matID, E, G, nu)
-                self.bdfInfo.add_pbar(element.pid, matID)
+        # Collect the set of undefined property IDs in one pass,
+        # rather than re-adding dummy cards once per referencing element
+        definedPropertyIDs = set(self.bdfInfo.property_ids)
+        missingPIDs = set()
+        for element_id, element in self.bdfInfo.elements.items():
+            if element.pid not in definedPropertyIDs and element.pid not in missingPIDs:
+                missingPIDs.add(element.pid)
                 # Warn the user that the property card is missing
                 # and should not be read in using pytacs elemCallBackFromBDF method
-                self.bdfInfo.missing_properties = True
                 if self.printDebug:
                     self._TACSWarning(
                         "Element ID %d references undefined property ID %d in bdf file. "
@@ -88,19 +129,42 @@ class pyMeshLoader(BaseUI):
                         % (element_id, element.pid)
                     )
 
+        if missingPIDs:
+            # If no material properties were found,
+            # add one dummy material and a dummy property per missing ID
+            matID = 1
+            E = 70.0
+            G = 35.0
+            nu = 0.3
+            self.bdfInfo.add_mat1(matID, E, G, nu)
+            for pid in sorted(missingPIDs):
+                self.bdfInfo.add_pbar(pid, matID)
+            self.bdfInfo.missing_properties = True
+
         # We have to remove any empty property groups that may have been read in from the BDF
-        self.propertyIDToElementIDDict = (
-            self.bdfInfo.get_property_id_to_element_ids_map()
-        )
-        for pid in self.propertyIDToElementIDDict:
-            # If there are no elements referencing this property card, remove it
-            if len(self.propertyIDToElementIDDict[pid]) == 0:
+        propertyIDToElementIDDict = self.bdfInfo.get_property_id_to_element_ids_map()
+        # If there are no elements referencing a property card, remove it
+        for pid, elemIDs in propertyIDToElementIDDict.items():
+            if len(elemIDs) == 0:
                 self.bdfInfo.properties.pop(pid)
-                self.propertyIDToElementIDDict.pop(pid)
+        # Rebuild the map with only the referenced property groups in one pass
+        self.propertyIDToElementIDDict = {
+            pid: elemIDs
+            for pid, elemIDs in propertyIDToElementIDDict.items()
+            if len(elemIDs) > 0
+        }
 
         # Create dictionaries for mapping between tacs and nastran id numbering
         self._updateNastranToTACSDicts()
 
+        # Files that reference multiple coordinate systems have to be
+        # cross-referenced before node locations can be evaluated.
+        # Check for this up-front so the node coordinate evaluation
+        # doesn't have to be run twice on the fallback path
+        if len(self.bdfInfo.coords) > 1:
+            self.bdfInfo.cross_reference()
+            self.bdfInfo.is_xrefed = True
+
         # Try to get the node x,y,z locations from bdf file
         try:
             self.bdfXpts = self.bdfInfo.get_xyz_in_coord(
@@ -132,8 +196,11 @@ class pyMeshLoader(BaseUI):
             self.elemObjectNumByComp.append([])
             # Check if there is a Femap/HyperMesh/Patran label for this component
             propComment = self.bdfInfo.properties[pID].comment
+            # No comment at all (the common case), skip the substring searches
+            if not propComment:
+                self.compDescripts.append(f"Property group {pID}")
             # Femap format
-            if "$ Femap Property" in propComment:
+            elif "$ Femap Property" in propComment:
                 # Pick off last word from comment, this is the name
                 propName = propComment.split()[-1]
                 self.compDescripts.append(propName)
@@ -156,82 +223,112 @@ class pyMeshLoader(BaseUI):
                 self.compDescripts.append(f"Property group {pID}")
 
         # Element connectivity information
-        self.elemConnectivity = [None] * self.bdfInfo.nelements
-        self.elemConnectivityPointer = [None] * (self.bdfInfo.nelements + 1)
-        self.elemConnectivityPointer[0] = 0
+        nElements = self.bdfInfo.nelements
+        # Flat buffer holding the connectivity of every element (Nastran numbering)
+        # and the number of nodes for each element
+        flatConn = []
+        connLengths = np.zeros(nElements + 1, dtype=np.intc)
         elementObjectCounter = 0
         # List specifying which tacs element object each element in bdf should point to
-        self.elemObjectNumByElem = [None] * (self.bdfInfo.nelements)
+        self.elemObjectNumByElem = [None] * nElements
+        # Many elements share the exact same comment string,
+        # so cache the ICEM family-name parse per unique comment
+        elemCommentCache = {}
+        # Per-component hashed lookup from element type to its type index,
+        # avoids repeated list membership tests and .index scans below
+        elemTypeIndexByComp = [{} for _ in self.elemDescripts]
 
         # Loop through every element and record information needed for tacs
-        for tacsElementID, nastranElementID in enumerate(self.bdfInfo.element_ids):
-            element = self.bdfInfo.elements[nastranElementID]
+        bdfElements = self.bdfInfo.elements
+        for tacsElementID, nastranElementID in enumerate(
+            self.tacsToNastranElemIDArray.tolist()
+        ):
+            element = bdfElements[nastranElementID]
             elementType = element.type.upper()
             propertyID = element.pid
             componentID = self.idMap(propertyID, self.nastranToTACSCompIDDict)
 
+            # Find the index number corresponding to the element object number for this component
+            componentTypeIndex = elemTypeIndexByComp[componentID].get(elementType)
             # This element type has not been added to the list for the component group yet, so we append it
-            if elementType not in self.elemDescripts[componentID]:
+            if componentTypeIndex is None:
+                componentTypeIndex = len(self.elemDescripts[componentID])
+                elemTypeIndexByComp[componentID][elementType] = componentTypeIndex
                 self.elemDescripts[componentID].append(elementType)
                 self.elemObjectNumByComp[componentID].append(elementObjectCounter)
                 elementObjectCounter += 1
 
-            # Find the index number corresponding to the element object number for this component
-            componentTypeIndex = self.elemDescripts[componentID].index(elementType)
             self.elemObjectNumByElem[tacsElementID] = self.elemObjectNumByComp[
                 componentID
             ][componentTypeIndex]
 
             # We've identified a ICEM property label
-            if "Shell element data for family" in element.comment:
-                componentName = element.comment.split()[-1]
-                self.compDescripts[componentID] = componentName
-
-            conn = element.nodes.copy()
+            elemComment = element.comment
+            if elemComment:
+                componentName = elemCommentCache.get(elemComment)
+                if componentName is None:
+                    if "Shell element data for family" in elemComment:
+                        componentName = elemComment.split()[-1]
+                    else:
+                        componentName = ""
+                    elemCommentCache[elemComment] = componentName
+                if componentName:
+                    self.compDescripts[componentID] = componentName
+
+            # The element's node list is only read here (the reordering below
+            # builds a fresh list), so no defensive copy is needed
+            conn = element.nodes
 
             # TACS has a different node ordering than Nastran for certain elements,
-            # we now perform the reordering (if necessary)
-            if elementType in ["CQUAD4", "CQUADR"]:
-                conn = [conn[0], conn[1], conn[3], conn[2]]
-            elif elementType in ["CQUAD9", "CQUAD"]:
-                conn = [
-                    conn[0],
-                    conn[4],
-                    conn[1],
-                    conn[7],
-                    conn[8],
-                    conn[5],
-                    conn[3],
-                    conn[6],
-                    conn[2],
-                ]
-            elif elementType in ["CHEXA8", "CHEXA"]:
-                conn = [
-                    conn[0],
-                    conn[1],
-                    conn[3],
-                    conn[2],
-                    conn[4],
-                    conn[5],
-                    conn[7],
-                    conn[6],
-                ]
-
-            # Map node ids in connectivity from Nastran numbering to TACS numbering
-            self.elemConnectivity[tacsElementID] = self.idMap(
-                conn, self.nastranToTACSNodeIDDict
-            )
-            self.elemConnectivityPointer[
-                tacsElementID + 1
-            ] = self.elemConnectivityPointer[tacsElementID] + len(element.nodes)
+            # we now perform the reordering with a precomputed permutation (if necessary)
+            order = _NASTRAN_TO_TACS_NODE_ORDER.get(elementType)
+            if order is not None:
+                conn = [conn[i] for i in order]
+
+            # Record connectivity (Nastran numbering) in the flat buffer.
+            # The node count comes from the local conn list, not another
+            # element.nodes property access
+            flatConn.extend(conn)
+            connLengths[tacsElementID + 1] = len(conn)
+
+        # Map node ids in connectivity from Nastran numbering to TACS numbering.
+        # This is done for the entire flattened connectivity in one vectorized pass:
+        # translate each unique node ID through the dict once,
+        # then scatter back with fancy indexing
+        self.elemConnectivityPointer = np.cumsum(connLengths).tolist()
+        flatConn = np.array(flatConn, dtype=np.intc)
+        uniqueNodes, inverse = np.unique(flatConn, return_inverse=True)
+        uniqueTACSNodes = np.array(
+            self.idMap(uniqueNodes.tolist(), self.nastranToTACSNodeIDDict),
+            dtype=np.intc,
+        )
+        # Keep the contiguous flat connectivity buffer for the bdf elements;
+        # the per-element entries below are just views into it.
+        # RBE/mass elements appended later tack their connectivity lists onto
+        # elemConnectivity, so the number of bdf-scanned elements is recorded
+        self.elemConnectivityFlat = np.ascontiguousarray(uniqueTACSNodes[inverse])
+        self.numScannedElements = nElements
+        ptr = self.elemConnectivityPointer
+        self.elemConnectivity = [
+            self.elemConnectivityFlat[ptr[i] : ptr[i + 1]] for i in range(nElements)
+        ]
 
         # Allocate list for user-specified tacs element objects
         self.elemObjects = [None] * elementObjectCounter
 
         # Total number of nodes used to hold lagrange multiplier variables
         self.numMultiplierNodes = 0
-        # List to hold ID numbers (TACS ordering) of multiplier nodes added to the problem later
-        self.multiplierNodeIDs = []
+        # Array holding ID numbers (TACS ordering) of multiplier nodes,
+        # preallocated to its final size in createTACSAssembler
+        self.multiplierNodeIDs = np.empty(0, dtype=int)
+        # Flat connectivity of appended RBE/mass elements,
+        # populated in createTACSAssembler
+        self.elemConnectivityAppended = np.empty(0, dtype=np.intc)
+        # Bitmap of element-attached nodes (TACS ordering), maintained
+        # incrementally as elements are added so the unattached-node check
+        # doesn't need its own pass over the connectivity
+        self._attachedNodeMask = np.zeros(self.bdfInfo.nnodes, dtype=bool)
+        self._attachedNodeMask[self.elemConnectivityFlat] = True
 
     def _updateNastranToTACSDicts(self):
         """
@@ -247,22 +344,45 @@ class pyMeshLoader(BaseUI):
         not just those *owned* by this processor
         """
         # Create Node ID map
-        nastranIDs = self.bdfInfo.node_ids
+        nastranIDs = list(self.bdfInfo.node_ids)
         tacsIDs = range(self.bdfInfo.nnodes)
         nodeTuple = zip(nastranIDs, tacsIDs)
         self.nastranToTACSNodeIDDict = dict(nodeTuple)
+        # Cache the inverse map, pyNastran rebuilds node_ids on every access
+        self.tacsToNastranNodeIDArray = np.array(nastranIDs)
 
         # Create Property/Component ID map
-        nastranIDs = self.bdfInfo.property_ids
+        nastranIDs = list(self.bdfInfo.property_ids)
         tacsIDs = range(self.bdfInfo.nproperties)
         propTuple = zip(nastranIDs, tacsIDs)
         self.nastranToTACSCompIDDict = dict(propTuple)
+        # Cache the inverse map as an array indexed by TACS component ID,
+        # so per-call list(self.bdfInfo.property_ids) conversions aren't needed
+        self.tacsToNastranPropIDArray = np.array(nastranIDs)
 
         # Create Element ID map
-        nastranIDs = self.bdfInfo.element_ids
+        nastranIDs = list(self.bdfInfo.element_ids)
         tacsIDs = range(self.bdfInfo.nelements)
         elemTuple = zip(nastranIDs, tacsIDs)
         self.nastranToTACSElemIDDict = dict(elemTuple)
+        # Cache the inverse map, pyNastran rebuilds element_ids on every access
+        self.tacsToNastranElemIDArray = np.array(nastranIDs)
+
+        # Contiguous nastran-to-tacs lookup arrays used by idMap for fancy-indexed
+        # translation, skipped when the nastran numbering is too sparse to index densely
+        self._idMapArrays = {}
+        for IDDict, nastranIDArray in (
+            (self.nastranToTACSNodeIDDict, self.tacsToNastranNodeIDArray),
+            (self.nastranToTACSCompIDDict, self.tacsToNastranPropIDArray),
+            (self.nastranToTACSElemIDDict, self.tacsToNastranElemIDArray),
+        ):
+            if len(nastranIDArray) == 0:
+                continue
+            maxID = int(nastranIDArray.max())
+            if maxID + 1 <= 10 * len(nastranIDArray):
+                mapArray = np.full(maxID + 1, -1, dtype=np.intc)
+                mapArray[nastranIDArray] = np.arange(len(nastranIDArray), dtype=np.intc)
+                self._idMapArrays[id(IDDict)] = mapArray
 
     def getBDFInfo(self):
         """
@@ -343,8 +463,16 @@ class pyMeshLoader(BaseUI):
             List containing componentID of each element found in the bdf file.
         """
         elements = self.bdfInfo.elements
-        propertyIDList = [elements[eID].pid for eID in self.bdfInfo.element_ids]
-        compIDList = self.idMap(propertyIDList, self.nastranToTACSCompIDDict)
+        propertyIDs = np.array(
+            [elements[eID].pid for eID in self.tacsToNastranElemIDArray.tolist()]
+        )
+        # Map each unique property ID through the ID dict only once,
+        # then scatter back to every element with fancy indexing
+        uniquePropIDs, inverse = np.unique(propertyIDs, return_inverse=True)
+        uniqueCompIDs = np.array(
+            self.idMap(uniquePropIDs.tolist(), self.nastranToTACSCompIDDict)
+        )
+        compIDList = uniqueCompIDs[inverse].tolist()
         return compIDList
 
     def getConnectivityForComp(self, componentID, nastranOrdering=False):
@@ -366,7 +494,7 @@ class pyMeshLoader(BaseUI):
             List of nodal connectivities of each element belonging to this component.
         """
         # Find all of the element IDs belonging to this property group
-        propertyID = list(self.bdfInfo.property_ids)[componentID]
+        propertyID = int(self.tacsToNastranPropIDArray[componentID])
         elementIDs = self.propertyIDToElementIDDict[propertyID]
         compConn = []
         for elementID in elementIDs:
@@ -454,18 +582,27 @@ class pyMeshLoader(BaseUI):
         OwnerRange = self.assembler.getOwnerRange()
         nodeOffset = OwnerRange[self.comm.rank]
 
-        # Get the local ID numbers for this proc
+        # Get the local ID numbers for this proc.
+        # The underlying creator call is relatively expensive and this method is
+        # often called repeatedly with the same IDs, so memoize each lookup.
+        # The cache is reset whenever a new assembler is created.
+        cache = self._localNodeIDCache
         tacsLocalIDs = []
         for gID in globalIDs:
-            lIDs = self.creator.getAssemblerNodeNums(
-                self.assembler, np.array([gID], dtype=np.intc)
-            )
-            # Node was not found on this proc, return -1
-            if len(lIDs) == 0:
-                tacsLocalIDs.append(-1)
-            # Node was found on this proc, shift by nodeOffset to get local index for node
-            else:
-                tacsLocalIDs.append(lIDs[0] - nodeOffset)
+            gID = int(gID)
+            lID = cache.get(gID)
+            if lID is None:
+                lIDs = self.creator.getAssemblerNodeNums(
+                    self.assembler, np.array([gID], dtype=np.intc)
+                )
+                # Node was not found on this proc, return -1
+                if len(lIDs) == 0:
+                    lID = -1
+                # Node was found on this proc, shift by nodeOffset to get local index for node
+                else:
+                    lID = int(lIDs[0]) - nodeOffset
+                cache[gID] = lID
+            tacsLocalIDs.append(lID)
 
         return tacsLocalIDs
 
@@ -498,16 +635,10 @@ class pyMeshLoader(BaseUI):
         # Ensure input is list-like
         globalIDs = np.atleast_1d(globalIDs)
 
-        # Get the local ID numbers for this proc
-        tacsLocalIDs = []
-        for gID in globalIDs:
-            # element was found on this proc, get local ID num
-            if gID in self.globalToLocalElementIDDict:
-                lID = self.globalToLocalElementIDDict[gID]
-            # element was not found on this proc, return -1
-            else:
-                lID = -1
-            tacsLocalIDs.append(lID)
+        # Get the local ID numbers for this proc in a single comprehension,
+        # with -1 filled in for any element not found on this proc
+        lookup = self.globalToLocalElementIDDict.get
+        tacsLocalIDs = [lookup(int(gID), -1) for gID in globalIDs]
 
         return tacsLocalIDs
 
@@ -534,19 +665,34 @@ class pyMeshLoader(BaseUI):
         # to. Only the root rank need do this:
         uniqueNodes = None
         if self.comm.rank == 0:
-            allNodes = []
-            componentIDs = self._flatten(componentIDs)
-            componentIDs = set(componentIDs)
+            connArrays = []
+            componentIDs = set(self._flatten(componentIDs))
             for cID in componentIDs:
                 tmp = self.getConnectivityForComp(cID, nastranOrdering=nastranOrdering)
-                allNodes.extend(self._flatten(tmp))
+                connArrays.extend(np.asarray(conn) for conn in tmp)
 
-            # Now just unique all the nodes:
-            uniqueNodes = np.unique(allNodes)
+            # Concatenate all element connectivities and unique the nodes in one shot,
+            # rather than flattening through nested python lists
+            if connArrays:
+                uniqueNodes = np.unique(np.concatenate(connArrays))
+            else:
+                uniqueNodes = np.array([], dtype=int)
 
-        uniqueNodes = self.comm.bcast(uniqueNodes, root=0)
+        # Broadcast with the typed-buffer Bcast rather than a pickled bcast:
+        # share the array size first, then fill a preallocated buffer on the
+        # non-root procs
+        if self.comm.rank == 0:
+            uniqueNodes = np.ascontiguousarray(uniqueNodes, dtype=np.int64)
+            numUnique = uniqueNodes.size
+        else:
+            numUnique = None
+        numUnique = self.comm.bcast(numUnique, root=0)
+        if self.comm.rank != 0:
+            uniqueNodes = np.empty(numUnique, dtype=np.int64)
+        self.comm.Bcast(uniqueNodes, root=0)
 
-        return list(uniqueNodes)
+        # Hand back a plain list, which callers concatenate and compare
+        return uniqueNodes.tolist()
 
     def getLocalNodeIDsForComps(self, componentIDs):
         """
@@ -594,18 +740,20 @@ class pyMeshLoader(BaseUI):
         elemIDs : list[int]
             List of global element IDs belonging to the specified components.
         """
-        # Make sure list is flat
-        componentIDs = self._flatten(componentIDs)
-        # Convert tacs component IDs to nastran property IDs
-        propertyIDs = [0] * len(componentIDs)
-        for i, componentID in enumerate(componentIDs):
-            propertyIDs[i] = list(self.bdfInfo.property_ids)[componentID]
+        # Make sure the requested component IDs are flat and unique up-front
+        componentIDs = np.unique(self._flatten(componentIDs))
+        # Convert tacs component IDs to nastran property IDs with the cached array
+        propertyIDs = self.tacsToNastranPropIDArray[componentIDs].tolist()
         # Get dictionary whose values are the element ids we are looking for
         elementIDDict = self.bdfInfo.get_element_ids_dict_with_pids(propertyIDs)
-        # Convert to list
-        elementIDs = list(elementIDDict.values())
-        # Make sure list is flat
-        elementIDs = self._flatten(elementIDs)
+        # Flatten the per-property ID lists with a single concatenate
+        idLists = list(elementIDDict.values())
+        if idLists:
+            elementIDs = np.concatenate(
+                [np.asarray(ids, dtype=int) for ids in idLists]
+            ).tolist()
+        else:
+            elementIDs = []
         # Convert to tacs element numbering, if necessary
         if not nastranOrdering:
             elementIDs = self.idMap(elementIDs, self.nastranToTACSElemIDDict)
@@ -694,13 +842,13 @@ class pyMeshLoader(BaseUI):
         """
         # Do sorting on root proc
         if self.comm.rank == 0:
-            # List containing which poc every element belongs to
-            elemPartition = self.creator.getElementPartition()
-            # Create an empty list that we will use to sort what elements are on what procs
-            allOwnedElementIDs = [[] for proc_i in range(self.comm.size)]
-            for elemGlobalID in range(len(elemPartition)):
-                ownerProc = elemPartition[elemGlobalID]
-                allOwnedElementIDs[ownerProc].append(elemGlobalID)
+            # Array containing which proc every element belongs to
+            elemPartition = np.asarray(self.creator.getElementPartition())
+            # Group the global element IDs by owning proc with a stable argsort,
+            # rather than appending to a list of lists one element at a time
+            sortedElemIDs = np.argsort(elemPartition, kind="stable")
+            procCounts = np.bincount(elemPartition, minlength=self.comm.size)
+            allOwnedElementIDs = np.split(sortedElemIDs, np.cumsum(procCounts)[:-1])
         else:
             allOwnedElementIDs = None
 
@@ -708,7 +856,7 @@ class pyMeshLoader(BaseUI):
         ownedElementIDs = self.comm.scatter(allOwnedElementIDs, root=0)
         # Create dictionary that gives the corresponding local ID for each global ID owned by this proc
         globalToLocalElementIDDict = {
-            gID: lID for lID, gID in enumerate(ownedElementIDs)
+            int(gID): lID for lID, gID in enumerate(ownedElementIDs)
         }
 
         return globalToLocalElementIDDict
@@ -795,6 +943,35 @@ class pyMeshLoader(BaseUI):
         """
         self.creator = tacs.TACS.Creator(self.comm, varsPerNode)
 
+        # The number of multiplier (dummy) nodes is known up-front:
+        # one per dependent node for RBE2, one per element for RBE3.
+        # Preallocate the multiplier node array to its final size
+        numDummyNodes = 0
+        for rbe in self.bdfInfo.rigid_elements.values():
+            if rbe.type == "RBE2":
+                numDummyNodes += len(rbe.dependent_nodes)
+            elif rbe.type == "RBE3":
+                numDummyNodes += 1
+        self.numMultiplierNodes = 0
+        self.multiplierNodeIDs = np.empty(numDummyNodes, dtype=int)
+        # Grow the attached-node bitmap to cover the dummy nodes up-front
+        if numDummyNodes > 0:
+            self._attachedNodeMask = np.concatenate(
+                [self._attachedNodeMask, np.zeros(numDummyNodes, dtype=bool)]
+            )
+        # Next available nastran node number for dummy nodes, kept as a running
+        # counter so each RBE doesn't redo an O(nnodes) max over node_ids
+        if numDummyNodes > 0:
+            self.nextDummyNodeID = max(self.bdfInfo.node_ids) + 1
+        # Dummy grids are collected during the RBE loop and added to the bdf
+        # afterwards, so pyNastran's card bookkeeping isn't hit once per node.
+        # The global node count is tracked with a running counter meanwhile
+        self._pendingDummyGrids = []
+        self.numGlobalNodes = self.bdfInfo.nnodes
+        # Connectivities for appended RBE/mass elements are accumulated in one
+        # flat typed buffer rather than a nested list of per-element lists
+        self._appendedConnFlat = array("i")
+
         # Append RBE elements to element list, these are not setup by the user
         for rbe in self.bdfInfo.rigid_elements.values():
             if rbe.type == "RBE2":
@@ -806,101 +983,215 @@ class pyMeshLoader(BaseUI):
                     f"Rigid element of type '{rbe.type}' is not supported"
                 )
 
+        # Add all deferred dummy grids to the bdf in one batch after the loop
+        for dummyNodeNum, dummyXyz in self._pendingDummyGrids:
+            self.bdfInfo.add_grid(dummyNodeNum, dummyXyz)
+        self._pendingDummyGrids = []
+
         # Append point mass elements to element list, these are not setup by the user
         for massInfo in self.bdfInfo.masses.values():
             # Find the dv dict for this mass element, if not found return empty
             dvDict = massDVs.get(massInfo.eid, {})
             self._addTACSMassElement(massInfo, varsPerNode, dvDict)
 
+        # Freeze the appended connectivities into a contiguous array and expose
+        # per-element views, matching the layout of the bdf-scanned elements
+        self.elemConnectivityAppended = np.frombuffer(
+            self._appendedConnFlat, dtype=np.intc
+        )
+        ptr = self.elemConnectivityPointer
+        offset = ptr[self.numScannedElements]
+        self.elemConnectivity.extend(
+            self.elemConnectivityAppended[ptr[i] - offset : ptr[i + 1] - offset]
+            for i in range(self.numScannedElements, len(ptr) - 1)
+        )
+
         # Check for any nodes that aren't attached to at least one element
         self._unattachedNodeCheck()
 
-        # Setup element connectivity and boundary condition info on root processor
+        # Setup element connectivity info on root processor
         if self.comm.rank == 0:
             # Set connectivity for all elements
             ptr = np.array(self.elemConnectivityPointer, dtype=np.intc)
-            # Flatten nested connectivity list to single list
-            conn = it.chain.from_iterable(self.elemConnectivity)
-            conn = np.array([*conn], dtype=np.intc)
+            # Fill a preallocated flat buffer: both the bdf-scanned and the
+            # appended RBE/mass portions are contiguous arrays, so the full
+            # connectivity is assembled with two block copies
+            conn = np.empty(ptr[-1], dtype=np.intc)
+            nScanned = self.elemConnectivityFlat.size
+            conn[:nScanned] = self.elemConnectivityFlat
+            conn[nScanned:] = self.elemConnectivityAppended
             objectNums = np.array(self.elemObjectNumByElem, dtype=np.intc)
             self.creator.setGlobalConnectivity(
                 self.bdfInfo.nnodes, ptr, conn, objectNums
             )
 
-            # Set up the boundary conditions
-            bcDict = {}
-            for spc_id in self.bdfInfo.spcs:
-                for spc in self.bdfInfo.spcs[spc_id]:
-                    # Loop through every node specifed in this spc and record bc info
-                    for j, nastranNode in enumerate(spc.nodes):
-                        # If constrained node doesn't exist in bdf
-                        if nastranNode not in self.bdfInfo.node_ids:
-                            self._TACSWarning(
-                                f"Node ID {nastranNode} (Nastran ordering) is referenced by an SPC,  "
-                                "but the node was not defined in the BDF file. Skipping SPC."
-                            )
+        # Set up the boundary conditions.
+        # The bdf is replicated on every proc, so the SPC cards are parsed
+        # round-robin across procs, each accumulating its share of flat
+        # (node, dof, value) triples, which are then gathered on the root proc
+        # and merged into node-sorted arrays
+        bcNodeList = []
+        bcDofList = []
+        bcValList = []
+        # Global card index of each triple, so duplicate constraints can be
+        # resolved in bdf card order no matter how the cards were split
+        # across procs
+        bcCardList = []
+        # SPC nodes that aren't defined in the bdf; warnings only print on the
+        # root proc, so these are collected and gathered there after the loop
+        skippedBCNodes = []
+        # Constraint component strings repeat across nodes/cards, so each
+        # unique string is parsed into tacs dof indices only once
+        # (dof + 1 is the nastran dof number)
+        dofCache = {}
+
+        def parseConstrainedDOFs(constrainedDOFs):
+            dofs = dofCache.get(constrainedDOFs)
+            if dofs is None:
+                dofs = tuple(
+                    dof
+                    for dof in range(varsPerNode)
+                    if self._isDOFInString(constrainedDOFs, dof + 1)
+                )
+                dofCache[constrainedDOFs] = dofs
+            return dofs
+
+        # Track whether any constraint actually enforces a non-zero value;
+        # SPC1s never do and most SPCs don't either
+        anyNonzeroEnforced = False
+        for i, spc_id in enumerate(self.bdfInfo.spcs):
+            if i % self.comm.size != self.comm.rank:
+                continue
+            for spc in self.bdfInfo.spcs[spc_id]:
+                if spc.type != "SPC":  # SPC1?
+                    # All nodes on an SPC1 share the same constrained dofs and
+                    # always a zero enforced value, so both are hoisted out of
+                    # the per-node loop
+                    dofs = parseConstrainedDOFs(spc.components)
+                    zeroVals = [0.0] * len(dofs)
+                    for nastranNode in spc.nodes:
+                        tacsNode = self.nastranToTACSNodeIDDict.get(nastranNode)
+                        if tacsNode is None:
+                            skippedBCNodes.append(nastranNode)
                             continue
+                        bcNodeList.extend([tacsNode] * len(dofs))
+                        bcDofList.extend(dofs)
+                        bcValList.extend(zeroVals)
+                        bcCardList.extend([i] * len(dofs))
+                    continue
+
+                # SPC cards may constrain each node's dofs uniquely,
+                # with possibly non-zero enforced values
+                for j, nastranNode in enumerate(spc.nodes):
+                    # Look up the TACS node ID, which doubles as the
+                    # existence check for the constrained node
+                    tacsNode = self.nastranToTACSNodeIDDict.get(nastranNode)
+                    # If constrained node doesn't exist in bdf
+                    if tacsNode is None:
+                        skippedBCNodes.append(nastranNode)
+                        continue
+
+                    dofs = parseConstrainedDOFs(spc.components[j])
+                    # The boundary condition may be forced to a non-zero value
+                    constrainedVal = spc.enforced[j]
+                    if constrainedVal != 0.0:
+                        anyNonzeroEnforced = True
+                    bcNodeList.extend([tacsNode] * len(dofs))
+                    bcDofList.extend(dofs)
+                    bcValList.extend([constrainedVal] * len(dofs))
+                    bcCardList.extend([i] * len(dofs))
+
+        # Report any undefined SPC nodes from the root proc,
+        # since _TACSWarning is silent everywhere else
+        skippedBCNodes = self.comm.gather(skippedBCNodes, root=0)
+        if self.comm.rank == 0:
+            for rankSkippedNodes in skippedBCNodes:
+                for nastranNode in rankSkippedNodes:
+                    self._TACSWarning(
+                        f"Node ID {nastranNode} (Nastran ordering) is referenced by an SPC,  "
+                        "but the node was not defined in the BDF file. Skipping SPC."
+                    )
+
+        # When every constraint is zero-valued (the common case), the
+        # value arrays are never materialized in self.dtype (which may be
+        # complex) or gathered; the root simply allocates zeros after the merge
+        anyNonzeroEnforced = self.comm.allreduce(anyNonzeroEnforced, op=MPI.LOR)
 
-                        # Convert to TACS node ID
-                        tacsNode = self.idMap(nastranNode, self.nastranToTACSNodeIDDict)
-
-                        # If node hasn't been added to bc dict yet, add it
-                        if tacsNode not in bcDict:
-                            bcDict[tacsNode] = {}
-
-                        # Loop through each dof and record bc info if it is included in this spc
-                        for dof in range(varsPerNode):
-                            # Add 1 to get nastran dof number
-                            nastranDOF = dof + 1
-                            if spc.type == "SPC":
-                                # each node may have its own dofs uniquely constrained
-                                constrainedDOFs = spc.components[j]
-                                # The boundary condition may be forced to a non-zero value
-                                constrainedVal = spc.enforced[j]
-                            else:  # SPC1?
-                                # All nodes always have the same dofs constrained
-                                constrainedDOFs = spc.components
-                                # This boundary condition is always 0
-                                constrainedVal = 0.0
-                            # if nastran dof is in spc components string, add it to the bc dict
-                            if self._isDOFInString(constrainedDOFs, nastranDOF):
-                                bcDict[tacsNode][dof] = constrainedVal
-
-            # Convert bc information from dict to list
-            bcnodes = []
-            bcdofs = []
-            bcptr = [0]
-            bcvals = []
-            numbcs = 0
-            for tacsNode in bcDict:
-                bcnodes.append(tacsNode)
-                # Store constrained dofs for this node
-                dofs = bcDict[tacsNode].keys()
-                bcdofs.extend(dofs)
-                # Store enforced bc value
-                vals = bcDict[tacsNode].values()
-                bcvals.extend(vals)
-                # Increment bc pointer with how many constraints weve added for this node
-                numbcs += len(bcDict[tacsNode])
-                bcptr.append(numbcs)
-
-            # Recast lists as numpy arrays
-            bcnodes = np.array(bcnodes, dtype=np.intc)
-            bcdofs = np.array(bcdofs, dtype=np.intc)
-            bcptr = np.array(bcptr, dtype=np.intc)
-            bcvals = np.array(bcvals, dtype=self.dtype)
+        # Gather each proc's share of the constraint triples on the root proc
+        localBCNodes = np.array(bcNodeList, dtype=np.int64)
+        localBCDofs = np.array(bcDofList, dtype=np.intc)
+        localBCCards = np.array(bcCardList, dtype=np.intc)
+        bcCounts = self.comm.gather(localBCNodes.size, root=0)
+        if self.comm.rank == 0:
+            numBCTotal = sum(bcCounts)
+            bcnodes = np.empty(numBCTotal, dtype=np.int64)
+            bcdofs = np.empty(numBCTotal, dtype=np.intc)
+            bccards = np.empty(numBCTotal, dtype=np.intc)
+        else:
+            bcnodes = bcdofs = bccards = None
+        self.comm.Gatherv(localBCNodes, (bcnodes, bcCounts), root=0)
+        self.comm.Gatherv(localBCDofs, (bcdofs, bcCounts), root=0)
+        self.comm.Gatherv(localBCCards, (bccards, bcCounts), root=0)
+        if anyNonzeroEnforced:
+            localBCVals = np.array(bcValList, dtype=self.dtype)
+            if self.comm.rank == 0:
+                bcvals = np.empty(numBCTotal, dtype=self.dtype)
+            else:
+                bcvals = None
+            self.comm.Gatherv(localBCVals, (bcvals, bcCounts), root=0)
+
+        if self.comm.rank == 0:
+            # Merge the triples into node-sorted bc arrays.
+            # Encode each node/dof pair as a single sortable key and stable
+            # sort on (key, card index): when the same pair is constrained on
+            # multiple cards, the last card in bdf order wins (matching the
+            # old dict overwrite behavior) regardless of how the cards were
+            # split across procs
+            bcKeys = bcnodes * varsPerNode + bcdofs
+            order = np.lexsort((bccards, bcKeys))
+            sortedKeys = bcKeys[order]
+            # Keep the last entry of each run of identical keys
+            keepLast = np.empty(sortedKeys.size, dtype=bool)
+            keepLast[:-1] = sortedKeys[1:] != sortedKeys[:-1]
+            if keepLast.size:
+                keepLast[-1] = True
+            uniqueKeys = sortedKeys[keepLast]
+            keepIndices = order[keepLast]
+            bcdofs = (uniqueKeys % varsPerNode).astype(np.intc)
+            if anyNonzeroEnforced:
+                bcvals = bcvals[keepIndices]
+            else:
+                bcvals = np.zeros(uniqueKeys.size, dtype=self.dtype)
+            # Collapse the node-major sorted keys into unique nodes
+            # and a pointer array holding each node's dof count
+            bcnodes, bcNodeCounts = np.unique(
+                uniqueKeys // varsPerNode, return_counts=True
+            )
+            bcnodes = bcnodes.astype(np.intc)
+            bcptr = np.zeros(len(bcnodes) + 1, dtype=np.intc)
+            bcptr[1:] = np.cumsum(bcNodeCounts)
             # Set boundary conditions in tacs
             self.creator.setBoundaryConditions(bcnodes, bcptr, bcdofs, bcvals)
 
-            # Set node locations
-            Xpts = self.bdfInfo.get_xyz_in_coord(fdtype=self.dtype, sort_ids=False)
-            self.creator.setNodes(Xpts.flatten())
+            # Set node locations. The coordinates were already read during
+            # scanBdfFile, so they only need to be re-fetched if dummy RBE
+            # grids were appended to the model since then
+            if self.numMultiplierNodes > 0:
+                Xpts = self.bdfInfo.get_xyz_in_coord(fdtype=self.dtype, sort_ids=False)
+            else:
+                Xpts = self.bdfXpts
+            # ravel returns a view of the contiguous coordinate array,
+            # flatten would copy it
+            self.creator.setNodes(Xpts.ravel())
 
         # Set the elements for each component
         self.creator.setElements(self.elemObjects)
 
         self.assembler = self.creator.createTACS()
 
+        # Reset the global-to-local node lookup cache for the new assembler
+        self._localNodeIDCache = {}
+
         self.globalToLocalElementIDDict = self.getGlobalToLocalElementIDDict()
 
         # If any multiplier nodes were added, record their local processor indices
@@ -935,12 +1226,8 @@ class pyMeshLoader(BaseUI):
         # For this reason, we'll treat 0 as if its 7, since it's traditionally never used in nastran
         if dof == "7":
             dof = "0"
-        location = constrained_dofs.find(dof)
         # if dof is found, return true
-        if location > -1:
-            return True
-        else:
-            return False
+        return dof in constrained_dofs
 
     def _addTACSRBE2(self, rbeInfo, varsPerNode):
         """
@@ -957,37 +1244,46 @@ class pyMeshLoader(BaseUI):
         """
         indepNode = rbeInfo.independent_nodes
         depNodes = []
-        depConstrainedDOFs = []
         dummyNodes = []
         dofsAsString = rbeInfo.cm
-        dofsAsList = self.dofStringToList(dofsAsString, varsPerNode)
+        dofsAsArray = self._dofStringToArray(dofsAsString, varsPerNode)
+        # TACS IDs of the new dummy nodes follow directly from the running
+        # global node counter, so the nastran-to-tacs dict is updated with a
+        # single batch insert after the loop instead of one write per node
+        firstDummyTACSID = self.numGlobalNodes
         for node in rbeInfo.dependent_nodes:
             depNodes.append(node)
-            depConstrainedDOFs.extend(dofsAsList)
             # add dummy nodes for all lagrange multiplier
-            dummyNodeNum = (
-                max(self.bdfInfo.node_ids) + 1
-            )  # Next available nastran node number
-            # Add the dummy node coincident to the dependent node in x,y,z
-            self.bdfInfo.add_grid(dummyNodeNum, self.bdfInfo.nodes[node].xyz)
-            # Update Nastran to TACS ID mapping dicts, since we just added new nodes to model
-            self.nastranToTACSNodeIDDict[dummyNodeNum] = self.bdfInfo.nnodes - 1
+            # Next available nastran node number from the running counter
+            dummyNodeNum = self.nextDummyNodeID
+            self.nextDummyNodeID += 1
+            # Queue the dummy node coincident to the dependent node in x,y,z
+            # (the grid card itself is added after the RBE loop)
+            self._pendingDummyGrids.append((dummyNodeNum, self.bdfInfo.nodes[node].xyz))
             dummyNodes.append(dummyNodeNum)
+        numDummyNodes = len(dummyNodes)
+        tacsIDs = range(firstDummyTACSID, firstDummyTACSID + numDummyNodes)
+        # Update Nastran to TACS ID mapping dicts, since we just added new nodes to model
+        self.nastranToTACSNodeIDDict.update(zip(dummyNodes, tacsIDs))
+        self.numGlobalNodes += numDummyNodes
 
         conn = indepNode + depNodes + dummyNodes
         nTotalNodes = len(conn)
-        # Add dummy nodes to lagrange multiplier node list
-        self.numMultiplierNodes += len(dummyNodes)
-        tacsIDs = self.idMap(dummyNodes, self.nastranToTACSNodeIDDict)
-        self.multiplierNodeIDs.extend(tacsIDs)
+        # Record dummy nodes in the preallocated lagrange multiplier node array
+        self.multiplierNodeIDs[
+            self.numMultiplierNodes : self.numMultiplierNodes + numDummyNodes
+        ] = tacsIDs
+        self.numMultiplierNodes += numDummyNodes
         # Append RBE information to the end of the element lists
-        self.elemConnectivity.append(self.idMap(conn, self.nastranToTACSNodeIDDict))
+        tacsConn = self.idMap(conn, self.nastranToTACSNodeIDDict)
+        self._appendedConnFlat.extend(tacsConn)
+        self._attachedNodeMask[tacsConn] = True
         self.elemConnectivityPointer.append(
             self.elemConnectivityPointer[-1] + nTotalNodes
         )
-        rbeObj = tacs.elements.RBE2(
-            nTotalNodes, np.array(depConstrainedDOFs, dtype=np.intc)
-        )
+        # Tile the cached per-node dof array instead of
+        # extending and converting a Python list per dependent node
+        rbeObj = tacs.elements.RBE2(nTotalNodes, np.tile(dofsAsArray, len(depNodes)))
         self.elemObjectNumByElem.append(len(self.elemObjects))
         self.elemObjects.append(rbeObj)
         return
@@ -1006,45 +1302,56 @@ class pyMeshLoader(BaseUI):
             Number of variables per node for the model.
         """
         depNode = rbeInfo.dependent_nodes
-        depConstrainedDOFs = self.dofStringToList(rbeInfo.refc, varsPerNode)
+        depConstrainedDOFs = self._dofStringToArray(rbeInfo.refc, varsPerNode)
 
         # add dummy node for lagrange multipliers
-        dummyNodeNum = max(self.bdfInfo.node_ids) + 1  # Next available node number
-        # Add the dummy node coincident to the dependent node in x,y,z
-        self.bdfInfo.add_grid(dummyNodeNum, self.bdfInfo.nodes[depNode[0]].xyz)
-        # Update Nastran to TACS ID mapping dicts, since we just added new nodes to model
-        self.nastranToTACSNodeIDDict[dummyNodeNum] = self.bdfInfo.nnodes - 1
+        # Next available node number from the running counter
+        dummyNodeNum = self.nextDummyNodeID
+        self.nextDummyNodeID += 1
+        # Queue the dummy node coincident to the dependent node in x,y,z
+        # (the grid card itself is added after the RBE loop)
+        self._pendingDummyGrids.append(
+            (dummyNodeNum, self.bdfInfo.nodes[depNode[0]].xyz)
+        )
+        # Update Nastran to TACS ID mapping dicts, since we just added new nodes to model.
+        # The dummy node's TACS ID follows directly from the global node counter
+        dummyTACSID = self.numGlobalNodes
+        self.nastranToTACSNodeIDDict[dummyNodeNum] = dummyTACSID
+        self.numGlobalNodes += 1
         dummyNodes = [dummyNodeNum]
-        # Add dummy node to lagrange multiplier node list
-        self.numMultiplierNodes += len(dummyNodes)
-        tacsIDs = self.idMap(dummyNodes, self.nastranToTACSNodeIDDict)
-        self.multiplierNodeIDs.extend(tacsIDs)
+        # Record dummy node in the preallocated lagrange multiplier node array
+        self.multiplierNodeIDs[self.numMultiplierNodes] = dummyTACSID
+        self.numMultiplierNodes += 1
 
-        # Get node and rbe3 weight info
+        # Get node and rbe3 weight info. Each group's weight and dof array
+        # are replicated across its nodes with repeat/tile rather than
+        # per-node Python list appends
         indepNodes = []
         indepWeights = []
         indepConstrainedDOFs = []
         for depNodeGroup in rbeInfo.wt_cg_groups:
             wt = depNodeGroup[0]
             dofsAsString = depNodeGroup[1]
-            dofsAsList = self.dofStringToList(dofsAsString, varsPerNode)
-            for node in depNodeGroup[2]:
-                indepNodes.append(node)
-                indepWeights.append(wt)
-                indepConstrainedDOFs.extend(dofsAsList)
+            dofsAsArray = self._dofStringToArray(dofsAsString, varsPerNode)
+            groupNodes = depNodeGroup[2]
+            indepNodes.extend(groupNodes)
+            indepWeights.append(np.repeat(wt, len(groupNodes)))
+            indepConstrainedDOFs.append(np.tile(dofsAsArray, len(groupNodes)))
 
         conn = depNode + indepNodes + dummyNodes
         nTotalNodes = len(conn)
         # Append RBE information to the end of the element lists
-        self.elemConnectivity.append(self.idMap(conn, self.nastranToTACSNodeIDDict))
+        tacsConn = self.idMap(conn, self.nastranToTACSNodeIDDict)
+        self._appendedConnFlat.extend(tacsConn)
+        self._attachedNodeMask[tacsConn] = True
         self.elemConnectivityPointer.append(
             self.elemConnectivityPointer[-1] + nTotalNodes
         )
         rbeObj = tacs.elements.RBE3(
             nTotalNodes,
-            np.array(depConstrainedDOFs, dtype=np.intc),
-            np.array(indepWeights),
-            np.array(indepConstrainedDOFs, dtype=np.intc),
+            depConstrainedDOFs.copy(),
+            np.concatenate(indepWeights),
+            np.concatenate(indepConstrainedDOFs),
         )
         self.elemObjectNumByElem.append(len(self.elemObjects))
         self.elemObjects.append(rbeObj)
@@ -1083,17 +1390,9 @@ class pyMeshLoader(BaseUI):
             massArgs.update(dvDict)
             con = tacs.constitutive.PointMassConstitutive(**massArgs)
         elif massInfo.type == "CONM1":
-            M = np.zeros(21)
-            M[0:6] = massInfo.mass_matrix[0:, 0]
-            M[6:11] = massInfo.mass_matrix[1:, 1]
-            M[11:15] = massInfo.mass_matrix[2:, 2]
-            M[15:18] = massInfo.mass_matrix[3:, 3]
-            M[18:20] = massInfo.mass_matrix[4:, 4]
-            M[20] = massInfo.mass_matrix[5, 5]
-            # off-diagonal moment of inertia terms have to be negated, since they aren't in nastran convention
-            M[16] *= -1.0
-            M[17] *= -1.0
-            M[19] *= -1.0
+            # Gather the lower triangle of the mass matrix in a single
+            # fancy-indexed pass, negating the off-diagonal inertia terms
+            M = massInfo.mass_matrix[_CONM1_ROWS, _CONM1_COLS] * _CONM1_SIGNS
             con = tacs.constitutive.GeneralMassConstitutive(M=M)
         else:
             raise NotImplementedError(
@@ -1102,7 +1401,9 @@ class pyMeshLoader(BaseUI):
 
         # Append point mass information to the end of the element lists
         conn = [massInfo.node_ids[0]]
-        self.elemConnectivity.append(self.idMap(conn, self.nastranToTACSNodeIDDict))
+        tacsConn = self.idMap(conn, self.nastranToTACSNodeIDDict)
+        self._appendedConnFlat.extend(tacsConn)
+        self._attachedNodeMask[tacsConn] = True
         self.elemConnectivityPointer.append(self.elemConnectivityPointer[-1] + 1)
         # Create tacs object for mass element
         massObj = tacs.elements.MassElement(con)
@@ -1118,20 +1419,26 @@ class pyMeshLoader(BaseUI):
         """
         numUnattached = 0
         if self.comm.rank == 0:
-            # Flatten connectivity to a single list
-            flattenedConn = it.chain.from_iterable(self.elemConnectivity)
-            # uniqueify and order all element-attached nodes
-            attachedNodes = set(flattenedConn)
-            # Loop through each node in the bdf and check if it's in the element node set
-            for nastranNodeID in self.bdfInfo.node_ids:
-                tacsNodeID = self.idMap(nastranNodeID, self.nastranToTACSNodeIDDict)
-                if tacsNodeID not in attachedNodes:
-                    if numUnattached < 100:
+            # The bitmap of element-attached nodes (indexed by TACS node ID)
+            # is maintained incrementally as elements are added,
+            # so only the scan for unset entries is left to do here
+            attachedMask = self._attachedNodeMask
+            numUnattached = int(attachedMask.size - np.count_nonzero(attachedMask))
+            if numUnattached > 0:
+                # Warn about the first 100 unattached nodes (Nastran ordering).
+                # The nastran-to-tacs dict is iterated directly since it covers every
+                # node (including RBE dummy nodes) without rebuilding pyNastran's
+                # node_ids list
+                numWarned = 0
+                for nastranNodeID, tacsNodeID in self.nastranToTACSNodeIDDict.items():
+                    if not attachedMask[tacsNodeID]:
                         self._TACSWarning(
                             f"Node ID {nastranNodeID} (Nastran ordering) is not attached to any element in the model. "
                             f"Please remove this node from the mesh and try again."
                         )
-                    numUnattached += 1
+                        numWarned += 1
+                        if numWarned == 100:
+                            break
 
         # Broadcast number of found unattached nodes
         numUnattached = self.comm.bcast(numUnattached, root=0)
@@ -1162,15 +1469,28 @@ class pyMeshLoader(BaseUI):
         dofList : list[int]
             List of booleans indicating which dofs are present in input string.
         """
-        dofList = []
-        for dof in range(numDOFs):
-            dof = str(dof + 1)
-            loc = dofString.find(dof)
-            if loc > -1:
-                dofList.append(1)
-            else:
-                dofList.append(0)
-        return dofList
+        # The same dof strings show up on many cards,
+        # so each (string, numDOFs) pair is only parsed once
+        key = (dofString, numDOFs)
+        dofList = self._dofListCache.get(key)
+        if dofList is None:
+            dofList = [1 if str(dof + 1) in dofString else 0 for dof in range(numDOFs)]
+            self._dofListCache[key] = dofList
+        # Return a copy so callers can't mutate the cached parse
+        return dofList[:]
+
+    def _dofStringToArray(self, dofString, numDOFs):
+        """
+        Same parse as `dofStringToList`, but cached as a numpy intc array so
+        RBE setup can tile/concatenate it without a per-call list conversion.
+        Callers must not mutate the returned array.
+        """
+        key = (dofString, numDOFs)
+        dofArray = self._dofArrayCache.get(key)
+        if dofArray is None:
+            dofArray = np.array(self.dofStringToList(dofString, numDOFs), dtype=np.intc)
+            self._dofArrayCache[key] = dofArray
+        return dofArray
 
     def idMap(self, fromIDs, tacsIDDict):
         """
@@ -1192,11 +1512,28 @@ class pyMeshLoader(BaseUI):
         """
         # Input is a list return a list
         if hasattr(fromIDs, "__iter__"):
-            toIDs = [None] * len(fromIDs)
-            # Iterate through list and call function recursively one element at a time
-            for i, id in enumerate(fromIDs):
-                toIDs[i] = self.idMap(id, tacsIDDict)
-            return toIDs
+            fromArr = np.asarray(fromIDs)
+            mapArray = self._idMapArrays.get(id(tacsIDDict))
+            if (
+                mapArray is not None
+                and fromArr.ndim == 1
+                and np.issubdtype(fromArr.dtype, np.integer)
+            ):
+                # Translate with one fancy-indexing pass through the contiguous
+                # lookup array. IDs beyond the array (e.g. dummy RBE nodes added
+                # after the scan) fall back to the dict
+                inRange = (0 <= fromArr) & (fromArr < mapArray.size)
+                toIDs = np.full(fromArr.size, -1, dtype=np.intc)
+                toIDs[inRange] = mapArray[fromArr[inRange]]
+                if not inRange.all():
+                    outIdx = np.nonzero(~inRange)[0]
+                    toIDs[outIdx] = [
+                        tacsIDDict.get(int(fromArr[i]), -1) for i in outIdx
+                    ]
+                return toIDs.tolist()
+            # Generic fallback (nested or non-integer input):
+            # call function recursively one element at a time
+            return [self.idMap(fromID, tacsIDDict) for fromID in fromIDs]
         # Input is a int, return an int
         else:
             if fromIDs in tacsIDDict:
@@ -1213,18 +1550,14 @@ class pyMeshLoader(BaseUI):
         nastran_node - 1 => tacs_idx owned by this proc
         """
 
-        self._nastranToLocalNodeIDMap()
-        all_struct_ids = None
-        local_maps = self.comm.gather(self._local_map, root=0)
-        if self.comm.rank == 0:
-            all_struct_ids = np.zeros((self.bdfInfo.nnodes), dtype=int)
-            for local_map in local_maps:
-                for key in local_map:
-                    all_struct_ids[int(key)] = map[int(key)]
-            all_struct_ids = list(all_struct_ids)
-        # broadcast to other procs
-        all_struct_ids = self.comm.bcast(all_struct_ids, root=0)
-        return all_struct_ids
+        # Each proc holds its local id (or -1) for every global node, so a
+        # single elementwise-max Allreduce on the typed buffers merges the
+        # owned entries everywhere at once, with no gather of per-proc dicts
+        # followed by a pickled bcast
+        local_struct_ids = np.array(self._getLocalNodeIDs(), dtype=np.intc)
+        all_struct_ids = np.empty_like(local_struct_ids)
+        self.comm.Allreduce(local_struct_ids, all_struct_ids, op=MPI.MAX)
+        return list(all_struct_ids)
 
     def _getLocalNodeIDs(self):
         """
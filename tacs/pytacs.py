@@ -87,6 +87,14 @@ class pyTACS(BaseUI):
             False,
             "Flag for whether to print debug information while loading file.",
         ],
+        "copyBDF": [
+            bool,
+            True,
+            "Flag for whether to deep copy a user-supplied pyNastran BDF object before loading.\n"
+            "\t Deep copying (the default) leaves the user's object untouched. Set to False to\n"
+            "\t skip the expensive copy of large models, in which case pyTACS may modify the\n"
+            "\t user's object (e.g. adding dummy property cards).",
+        ],
         # Output Options
         "outputElement": [
             int,
@@ -194,7 +202,7 @@ class pyTACS(BaseUI):
         # Create and load mesh loader object.
         debugFlag = self.getOption("printDebug")
         self.meshLoader = pyMeshLoader(self.comm, debugFlag)
-        self.meshLoader.scanBdfFile(bdf)
+        self.meshLoader.scanBdfFile(bdf, copyBDF=self.getOption("copyBDF"))
         # Save pynastran bdf object
         self.bdfInfo = self.meshLoader.getBDFInfo()
         self.bdfName = self.bdfInfo.bdf_filename